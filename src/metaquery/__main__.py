@@ -0,0 +1,4 @@
+"""Entry point for ``python -m metaquery``."""
+from .cli import app
+
+app()
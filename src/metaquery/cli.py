@@ -1,19 +1,33 @@
 from __future__ import annotations
 
+import argparse
 import json
+import os
+import sys
 from pathlib import Path
-from typing import Annotated
 
-import typer
-from rich.console import Console
-from rich.panel import Panel
+try:
+    import orjson
+except ImportError:  # optional, see the "fast" extra
+    orjson = None
 
 from .builder import build_sql_v1, build_sql_v2
 from .loader import YamlLoadError, load_fields, load_selection, load_views
 from .validator import validate_v1, validate_v2
 
-app = typer.Typer(add_completion=False)
-console = Console()
+
+def _panel(message: str, title: str, style: str) -> None:
+    """Plain-text block; a rich panel when METAQUERY_RICH is set and stdout is a terminal."""
+    if os.environ.get("METAQUERY_RICH") and sys.stdout.isatty():
+        try:
+            from rich.console import Console
+            from rich.panel import Panel
+        except ImportError:  # optional, see the "rich" extra
+            pass
+        else:
+            Console().print(Panel(message, title=title, style=style))
+            return
+    print(f"{title}\n{message}")
 
 
 def _write_text(path: Path, content: str) -> None:
@@ -21,44 +35,40 @@ def _write_text(path: Path, content: str) -> None:
 
 
 def _write_json(path: Path, obj: object) -> None:
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2) + b"\n")
+        return
     path.write_text(json.dumps(obj, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
 
 
-@app.command()
 def build(
-    selection: Annotated[Path, typer.Argument(help="Path to selection.yml")],
-    fields: Annotated[Path, typer.Option("--fields", help="Path to fields.yml")],
-    execute: Annotated[
-        bool, typer.Option("--execute", help="Execute the validated SQL on a SQLite database")
-    ] = False,
-    db: Annotated[
-        Path | None,
-        typer.Option("--db", help="Path to the SQLite database (required with --execute)"),
-    ] = None,
-    version: Annotated[str, typer.Option("--version", help="Governance rules: V1 or V2")] = "V1",
-    views: Annotated[
-        Path | None, typer.Option("--views", help="Path to views.yml (required with --version V2)")
-    ] = None,
-) -> None:
+    selection: Path,
+    fields: Path,
+    execute: bool = False,
+    db: Path | None = None,
+    version: str = "V1",
+    views: Path | None = None,
+) -> int:
     """
     Build a governed SQL query from YAML inputs.
     Outputs: query.sql, audit.json, explain.txt (+ extract.csv, manifest.json avec --execute)
+    Returns the process exit code.
     """
     version = version.upper()
     if version not in {"V1", "V2"}:
-        console.print(Panel("ERROR: --version doit valoir V1 ou V2", title="MetaQuery", style="red"))
-        raise typer.Exit(code=2)
+        _panel("ERROR: --version doit valoir V1 ou V2", "MetaQuery", "red")
+        return 2
     if version == "V2" and views is None:
-        console.print(Panel("ERROR: --views est requis avec --version V2", title="MetaQuery", style="red"))
-        raise typer.Exit(code=2)
+        _panel("ERROR: --views est requis avec --version V2", "MetaQuery", "red")
+        return 2
 
     try:
         fields_by_id = load_fields(fields)
         selected = load_selection(selection)
         views_by_id = load_views(views) if views is not None and version == "V2" else {}
     except YamlLoadError as e:
-        console.print(Panel(str(e), title="YAML ERROR", style="red"))
-        raise typer.Exit(code=2)
+        _panel(str(e), "YAML ERROR", "red")
+        return 2
 
     if version == "V2":
         deduped, audit = validate_v2(fields_by_id, selected, views_by_id)
@@ -71,10 +81,10 @@ def build(
 
     if audit.decision != "ALLOW":
         code = (audit.error or {}).get("code", "VALIDATION_ERROR")
-        console.print(Panel(f"ERROR: {code}\nDecision: BLOCK", title="VALIDATION", style="red"))
+        _panel(f"ERROR: {code}\nDecision: BLOCK", "VALIDATION", "red")
         if audit.error:
-            console.print(json.dumps(audit.error, indent=2, ensure_ascii=False))
-        raise typer.Exit(code=1)
+            print(json.dumps(audit.error, indent=2, ensure_ascii=False))
+        return 1
 
     # Build SQL
     if version == "V2":
@@ -86,57 +96,94 @@ def build(
     # --- V1.1 : execution optionnelle (SQLite) ---
     if execute:
         if db is None:
-            console.print(Panel("ERROR: --db est requis avec --execute", title="MetaQuery", style="red"))
-            raise typer.Exit(code=3)
+            _panel("ERROR: --db est requis avec --execute", "MetaQuery", "red")
+            return 3
         from .executor import build_manifest, execute_sql, inspect_sqlite_view, write_extract
         from .quality import run_quality
+
         try:
             view_sha = inspect_sqlite_view(db, audit.source or "") if version == "V2" else None
             df = execute_sql(db, sql)
         except Exception as e:  # noqa: BLE001 - SQL drivers expose several exception types
-            console.print(Panel(f"ERROR: EXECUTION_FAILED\n{e}", title="MetaQuery", style="red"))
-            raise typer.Exit(code=3)
+            _panel(f"ERROR: EXECUTION_FAILED\n{e}", "MetaQuery", "red")
+            return 3
         output_sha, n_rows = write_extract(df, "extract.csv")
         verdict, checks = run_quality(df)
-        build_manifest(fields_path=fields, sql=sql, source=audit.source or "",
-                       executed=True, output_file="extract.csv",
-                       output_sha256=output_sha, row_count=n_rows,
-                       quality_verdict=verdict, quality_checks=checks,
-                       governance_version=version, view_definition_sha256=view_sha)
+        build_manifest(
+            fields_path=fields,
+            sql=sql,
+            source=audit.source or "",
+            executed=True,
+            output_file="extract.csv",
+            output_sha256=output_sha,
+            row_count=n_rows,
+            quality_verdict=verdict,
+            quality_checks=checks,
+            governance_version=version,
+            view_definition_sha256=view_sha,
+        )
         style = {"PASS": "green", "WARN": "yellow", "BLOCK": "red"}[verdict]
-        console.print(Panel(f"EXECUTED: {n_rows} lignes -> extract.csv\nQualite: {verdict}\nManifeste: manifest.json",
-                            title=f"MetaQuery {version}", style=style))
+        _panel(
+            f"EXECUTED: {n_rows} lignes -> extract.csv\nQualite: {verdict}\nManifeste: manifest.json",
+            f"MetaQuery {version}",
+            style,
+        )
         if verdict == "BLOCK":
-            raise typer.Exit(code=4)
+            return 4
 
     # Explain
-    explain = []
-    explain.append(f"MetaQuery {version} Validation Report")
-    explain.append("==============================")
-    explain.append(f"Decision: {audit.decision}")
-    explain.append(f"Status: {audit.status}")
-    explain.append(f"Source: {audit.source}")
-    explain.append(f"Fields: {len(deduped)} selected")
-    explain.append("")
-    explain.append("Controls:")
-    for k, v in audit.controls.items():
-        mark = "✓" if v == "PASS" else "✗"
-        explain.append(f"  {mark} {k}")
+    explain = [
+        f"MetaQuery {version} Validation Report",
+        "==============================",
+        f"Decision: {audit.decision}",
+        f"Status: {audit.status}",
+        f"Source: {audit.source}",
+        f"Fields: {len(deduped)} selected",
+        "",
+        "Controls:",
+    ]
+    explain.extend(f"  {'✓' if v == 'PASS' else '✗'} {k}" for k, v in audit.controls.items())
     if audit.warnings:
-        explain.append("")
-        explain.append("Warnings:")
-        for w in audit.warnings:
-            explain.append(f"  - {w.get('code')}: {w.get('message')}")
-    explain.append("")
-    explain.append("Generated SQL:")
-    explain.append("--------------")
-    explain.append(sql.rstrip("\n"))
-    explain.append("")
+        explain += ["", "Warnings:"]
+        explain.extend(f"  - {w.get('code')}: {w.get('message')}" for w in audit.warnings)
+    explain += ["", "Generated SQL:", "--------------", sql.rstrip("\n"), ""]
 
     _write_text(Path("explain.txt"), "\n".join(explain))
 
-    console.print(Panel("OK: query.sql + audit.json + explain.txt generated", title="MetaQuery", style="green"))
-    raise typer.Exit(code=0)
+    _panel("OK: query.sql + audit.json + explain.txt generated", "MetaQuery", "green")
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="metaquery", description="Build a governed SQL query from YAML inputs."
+    )
+    parser.add_argument("selection", type=Path, help="Path to selection.yml")
+    parser.add_argument("--fields", type=Path, required=True, help="Path to fields.yml")
+    parser.add_argument(
+        "--execute", action="store_true", help="Execute the validated SQL on a SQLite database"
+    )
+    parser.add_argument(
+        "--db", type=Path, help="Path to the SQLite database (required with --execute)"
+    )
+    parser.add_argument("--version", default="V1", help="Governance rules: V1 or V2")
+    parser.add_argument("--views", type=Path, help="Path to views.yml (required with --version V2)")
+    return parser
+
+
+def app(argv: list[str] | None = None) -> None:
+    """Console entry point: parse arguments, run build() and exit with its code."""
+    args = _parser().parse_args(argv)
+    raise SystemExit(
+        build(
+            args.selection,
+            args.fields,
+            execute=args.execute,
+            db=args.db,
+            version=args.version,
+            views=args.views,
+        )
+    )
 
 
 if __name__ == "__main__":
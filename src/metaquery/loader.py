@@ -1,14 +1,29 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import json
+import os
+import sys
+from dataclasses import astuple, dataclass
+from dataclasses import fields as dc_fields
 from datetime import date
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# libyaml is the fast path. pyfastyaml (0.2.0) was evaluated as a faster backend but
+# mis-parses flow mappings such as examples/fields_rachats.yml, so it is not used.
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
 
-@dataclass(frozen=True)
+_CACHE_DIR: Path | None = None  # None: $XDG_CACHE_HOME/metaquery or ~/.cache/metaquery
+_CACHE_FORMAT = 1  # bump when the cache layout changes
+
+
+@dataclass(frozen=True, slots=True)
 class Field:
     field_id: str
     datatable_id: str
@@ -17,7 +32,7 @@ class Field:
     view_id: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class View:
     view_id: str
     status: str
@@ -36,14 +51,23 @@ class YamlLoadError(MetaQueryError):
 
 def _load_yaml(path: Path) -> dict[str, Any]:
     try:
-        text = path.read_text(encoding="utf-8")
+        fh = path.open("rb")
     except FileNotFoundError as e:
         raise YamlLoadError(f"File not found: {path}") from e
 
-    try:
-        data = yaml.safe_load(text)
-    except yaml.YAMLError as e:
-        raise YamlLoadError(f"Invalid YAML in {path}: {e}") from e
+    with fh:
+        # JSON is a subset of YAML; machine-generated .json inputs skip the YAML parser.
+        if path.suffix.lower() == ".json":
+            try:
+                data = json.load(fh)
+            except ValueError as e:
+                raise YamlLoadError(f"Invalid JSON in {path}: {e}") from e
+        else:
+            # The loader reads the stream itself, no intermediate copy of the whole file.
+            try:
+                data = yaml.load(fh, Loader=_Loader)
+            except yaml.YAMLError as e:
+                raise YamlLoadError(f"Invalid YAML in {path}: {e}") from e
 
     if data is None:
         data = {}
@@ -52,9 +76,62 @@ def _load_yaml(path: Path) -> dict[str, Any]:
     return data
 
 
+def _cache_dir() -> Path | None:
+    """Directory of the fields cache, or None when no home directory can be determined."""
+    if _CACHE_DIR is not None:
+        return _CACHE_DIR
+    try:
+        return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "metaquery"
+    except (RuntimeError, OSError, KeyError):
+        return None
+
+
 def load_fields(fields_path: str | Path) -> dict[str, Field]:
-    """Load fields.yml -> dict[field_id, Field]"""
+    """Load fields.yml -> dict[field_id, Field], reusing a parsed copy while the file is unchanged."""
     p = Path(fields_path)
+    try:
+        resolved = p.resolve()
+        st = resolved.stat()
+    except OSError:
+        return _parse_fields(p)  # let _load_yaml report the missing file
+    cache_dir = _cache_dir()
+    if cache_dir is None:
+        return _parse_fields(p)
+
+    # The cache holds JSON rows, rebuilt into Field on load: no pickle, and any change to
+    # the Field layout or cache format invalidates it through the key.
+    key = [
+        _CACHE_FORMAT,
+        [f.name for f in dc_fields(Field)],
+        os.fsencode(resolved).hex(),  # raw bytes: the path need not be valid UTF-8
+        st.st_mtime_ns,
+        st.st_size,
+    ]
+    digest = hashlib.sha256(os.fsencode(resolved)).hexdigest()[:16]
+    cache_path = cache_dir / f"fields-{digest}.json"
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        if cached["key"] == key:
+            return {
+                sys.intern(k): Field(sys.intern(fid), sys.intern(dt), *rest)
+                for k, fid, dt, *rest in cached["rows"]
+            }
+    except (OSError, ValueError, TypeError, KeyError):
+        pass  # missing, stale or unreadable cache: parse the YAML
+
+    out = _parse_fields(p)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        rows = [[k, *astuple(f)] for k, f in out.items()]
+        tmp.write_text(json.dumps({"key": key, "rows": rows}, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, cache_path)
+    except (OSError, ValueError):
+        pass  # the cache is an optimisation only
+    return out
+
+
+def _parse_fields(p: Path) -> dict[str, Field]:
     data = _load_yaml(p)
 
     raw_fields = data.get("fields")
@@ -85,9 +162,10 @@ def load_fields(fields_path: str | Path) -> dict[str, Field]:
         if view_id is not None and (not isinstance(view_id, str) or not view_id.strip()):
             raise YamlLoadError(f"fields[{i}].view_id must be a non-empty string if provided in {p}")
 
-        out[field_id] = Field(
-            field_id=field_id.strip(),
-            datatable_id=datatable_id.strip(),
+        # field_id/datatable_id are used as dict and set keys throughout validation
+        out[sys.intern(field_id)] = Field(
+            field_id=sys.intern(field_id.strip()),
+            datatable_id=sys.intern(datatable_id.strip()),
             sql_expr=sql_expr.strip(),
             label=label.strip() if isinstance(label, str) else None,
             view_id=view_id.strip() if isinstance(view_id, str) else None,
@@ -159,5 +237,5 @@ def load_selection(selection_path: str | Path) -> list[str]:
     for i, item in enumerate(raw_sel):
         if not isinstance(item, str) or not item.strip():
             raise YamlLoadError(f"selected_field_ids[{i}] must be a non-empty string in {p}")
-        out.append(item.strip())
+        out.append(sys.intern(item.strip()))
     return out
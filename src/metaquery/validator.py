@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from dataclasses import field as dc_field
 from datetime import UTC, datetime
@@ -8,15 +7,28 @@ from typing import Any
 
 from .loader import Field, View
 
-SOURCE_RE = re.compile(r"^[A-Z0-9_]+$")
-FIELD_ID_RE = re.compile(r"^[A-Za-z0-9_]+$")
+
+# Full-string checks for [A-Z0-9_]+ and [A-Za-z0-9_]+ using C string methods, not regex.
+# isascii() keeps isalnum() to [A-Za-z0-9]; "_" is mapped to a letter beforehand.
+def _is_source_name(s: str) -> bool:
+    return s.isascii() and s.replace("_", "A").isalnum() and s.upper() == s
+
+
+def _is_field_id(s: str) -> bool:
+    return s.isascii() and s.replace("_", "a").isalnum()
+
+
+def _utc_timestamp() -> str:
+    # Same output as strftime("%Y-%m-%dT%H:%M:%SZ") without the strftime call.
+    dt = datetime.now(UTC)
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}Z"
 
 
 @dataclass
 class ValidationResult:
     metaquery_version: str = "0.1.0"
     schema_version: int = 1
-    timestamp: str = dc_field(default_factory=lambda: datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"))
+    timestamp: str = dc_field(default_factory=_utc_timestamp)
     decision: str = "BLOCK"  # ALLOW or BLOCK
     status: str = "ERROR"  # OK or ERROR
     version: str = "V1"
@@ -43,7 +55,8 @@ def validate_v1(
       + datatable_id validation against ^[A-Z0-9_]+$
       + field_id validation against ^[A-Za-z0-9_]+$
     """
-    audit = ValidationResult(metaquery_version=metaquery_version)
+    # The timestamp is stamped by _finalize, once the decision is known.
+    audit = ValidationResult(metaquery_version=metaquery_version, timestamp="")
     audit.fields_selected = list(selected_field_ids)
 
     # Rule 1: Non-empty selection
@@ -57,8 +70,47 @@ def validate_v1(
 
     audit.controls["non_empty_selection"] = "PASS"
 
+    invalid_ids: list[str] = []
+    unknown: list[str] = []
+    duplicates: dict[str, int] = {}
+    selected_set = set(selected_field_ids)
+    # difference() probes the dict per selected id; `set - dict.keys()` walks every key.
+    unknown_set = selected_set.difference(fields_by_id)
+    if (
+        not unknown_set
+        and len(selected_set) == len(selected_field_ids)
+        and all(map(_is_field_id, selected_set))
+    ):
+        # Common case: known, well-formed and distinct ids; only the sources need checking.
+        deduped = list(selected_field_ids)
+        only_source = fields_by_id[deduped[0]].datatable_id
+        multi_source = any(fields_by_id[fid].datatable_id != only_source for fid in deduped)
+    else:
+        # Single pass over the selection: format, existence, dedupe and source tracking.
+        # Errors are still reported below in spec order.
+        deduped = []
+        seen: set[str] = set()
+        only_source = None
+        multi_source = False
+        for fid in selected_field_ids:
+            if not _is_field_id(fid):
+                invalid_ids.append(fid)
+                continue
+            if fid in unknown_set:
+                unknown.append(fid)
+                continue
+            if fid in seen:
+                duplicates[fid] = duplicates.get(fid, 1) + 1
+                continue
+            seen.add(fid)
+            deduped.append(fid)
+            src = fields_by_id[fid].datatable_id
+            if only_source is None:
+                only_source = src
+            elif src != only_source:
+                multi_source = True
+
     # Field ID format validation (basic safety)
-    invalid_ids = [fid for fid in selected_field_ids if not FIELD_ID_RE.match(fid)]
     if invalid_ids:
         audit.controls["all_fields_exist"] = "FAIL"
         audit.error = {
@@ -69,29 +121,18 @@ def validate_v1(
         return selected_field_ids, _finalize(audit)
 
     # Rule 3 (in spec order it's Rule 3 existence): Field existence
-    unknown = [fid for fid in selected_field_ids if fid not in fields_by_id]
     if unknown:
         audit.controls["all_fields_exist"] = "FAIL"
         audit.error = {
             "code": "FIELD_NOT_FOUND",
             "unknown_field_ids": unknown,
-            "available_fields": sorted(fields_by_id.keys()),
+            "available_fields": sorted(fields_by_id),
             "message": f"field_id(s) not defined in fields.yml: {', '.join(unknown)}",
         }
         return selected_field_ids, _finalize(audit)
     audit.controls["all_fields_exist"] = "PASS"
 
     # Rule 4: No duplicates -> auto-dedupe + warning
-    deduped: list[str] = []
-    seen: set[str] = set()
-    duplicates: dict[str, int] = {}
-    for fid in selected_field_ids:
-        if fid in seen:
-            duplicates[fid] = duplicates.get(fid, 1) + 1
-            continue
-        seen.add(fid)
-        deduped.append(fid)
-
     if duplicates:
         audit.controls["no_duplicates"] = "PASS"
         for fid, count in duplicates.items():
@@ -107,12 +148,11 @@ def validate_v1(
         audit.controls["no_duplicates"] = "PASS"
 
     # Rule 2: Single-source constraint (CRITICAL)
-    sources: dict[str, list[str]] = {}
-    for fid in deduped:
-        src = fields_by_id[fid].datatable_id
-        sources.setdefault(src, []).append(fid)
-
-    if len(sources) != 1:
+    # Sources are only grouped per field when they have to be reported.
+    if multi_source:
+        sources: dict[str, list[str]] = {}
+        for fid in deduped:
+            sources.setdefault(fields_by_id[fid].datatable_id, []).append(fid)
         audit.controls["single_source"] = "FAIL"
         audit.error = {
             "code": "MULTI_SOURCE_NOT_ALLOWED",
@@ -124,10 +164,9 @@ def validate_v1(
         return deduped, _finalize(audit)
 
     audit.controls["single_source"] = "PASS"
-    only_source = next(iter(sources.keys()))
 
     # Security: validate datatable_id format
-    if not SOURCE_RE.match(only_source):
+    if not _is_source_name(only_source):
         audit.controls["valid_source_name"] = "FAIL"
         audit.error = {
             "code": "INVALID_SOURCE_NAME",
@@ -159,7 +198,7 @@ def validate_v2(
     Fields may originate from several physical tables only through one common
     curated view whose catalogue status is VALIDATED.
     """
-    audit = ValidationResult(metaquery_version=metaquery_version, version="V2")
+    audit = ValidationResult(metaquery_version=metaquery_version, version="V2", timestamp="")
     audit.fields_selected = list(selected_field_ids)
 
     if not selected_field_ids:
@@ -171,7 +210,7 @@ def validate_v2(
         return selected_field_ids, _finalize(audit)
     audit.controls["non_empty_selection"] = "PASS"
 
-    invalid_ids = [fid for fid in selected_field_ids if not FIELD_ID_RE.match(fid)]
+    invalid_ids = [fid for fid in selected_field_ids if not _is_field_id(fid)]
     if invalid_ids:
         audit.controls["all_fields_exist"] = "FAIL"
         audit.error = {
@@ -181,8 +220,9 @@ def validate_v2(
         }
         return selected_field_ids, _finalize(audit)
 
-    unknown = [fid for fid in selected_field_ids if fid not in fields_by_id]
-    if unknown:
+    unknown_set = set(selected_field_ids).difference(fields_by_id)
+    if unknown_set:
+        unknown = [fid for fid in selected_field_ids if fid in unknown_set]
         audit.controls["all_fields_exist"] = "FAIL"
         audit.error = {
             "code": "FIELD_NOT_FOUND",
@@ -264,7 +304,7 @@ def validate_v2(
         return deduped, _finalize(audit)
     audit.controls["sources_covered_by_view"] = "PASS"
 
-    if not SOURCE_RE.match(view_id):
+    if not _is_source_name(view_id):
         audit.controls["valid_source_name"] = "FAIL"
         audit.error = {
             "code": "INVALID_SOURCE_NAME",
@@ -282,7 +322,8 @@ def validate_v2(
 
 
 def _finalize(audit: ValidationResult) -> ValidationResult:
-    # Derive status/decision if not already set to ALLOW/OK
+    # Stamp completion time, then derive status/decision if not already set to ALLOW/OK
+    audit.timestamp = _utc_timestamp()
     if audit.decision != "ALLOW":
         audit.decision = "BLOCK"
     if audit.status != "OK":
@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import pytest
+
+from metaquery import loader
+
+
+@pytest.fixture(autouse=True)
+def _isolated_cache(tmp_path, monkeypatch):
+    """Keep the fields cache out of the real ~/.cache for every test."""
+    monkeypatch.setattr(loader, "_CACHE_DIR", tmp_path / "cache")
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from metaquery import cli
+from metaquery.cli import app, build
+from metaquery.loader import load_fields, load_selection
+from metaquery.validator import validate_v1
+
+EXAMPLES = Path(__file__).resolve().parent.parent / "examples"
+
+
+@pytest.fixture(autouse=True)
+def _workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+
+def test_build_writes_outputs_on_allow(tmp_path):
+    assert build(EXAMPLES / "selection_ok.yml", EXAMPLES / "fields.yml") == 0
+    assert "FROM MODELS;" in (tmp_path / "query.sql").read_text(encoding="utf-8")
+    assert json.loads((tmp_path / "audit.json").read_text(encoding="utf-8"))["decision"] == "ALLOW"
+    assert (tmp_path / "explain.txt").exists()
+
+
+def test_build_blocks_multi_source(tmp_path):
+    assert build(EXAMPLES / "selection_reject.yml", EXAMPLES / "fields.yml") == 1
+    assert json.loads((tmp_path / "audit.json").read_text(encoding="utf-8"))["decision"] == "BLOCK"
+    assert not (tmp_path / "query.sql").exists()
+
+
+def test_app_exits_with_build_code():
+    with pytest.raises(SystemExit) as exc:
+        app(
+            [
+                str(EXAMPLES / "selection_ok.yml"),
+                "--fields",
+                str(EXAMPLES / "fields.yml"),
+                "--version",
+                "V3",
+            ]
+        )
+    assert exc.value.code == 2
+
+
+def test_audit_json_bytes_do_not_depend_on_orjson(tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    fields = load_fields(EXAMPLES / "fields.yml")
+    _, audit = validate_v1(fields, load_selection(EXAMPLES / "selection_reject.yml"))
+    audit.warnings.append({"code": "NOTE", "message": "Qualité vérifiée"})
+
+    cli._write_json(tmp_path / "with_orjson.json", audit.__dict__)
+    monkeypatch.setattr(cli, "orjson", None)
+    cli._write_json(tmp_path / "stdlib.json", audit.__dict__)
+
+    assert (tmp_path / "with_orjson.json").read_bytes() == (tmp_path / "stdlib.json").read_bytes()
+
+
+def test_python_m_metaquery_help():
+    src = str(Path(__file__).resolve().parent.parent / "src")
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")])),
+    }
+    proc = subprocess.run(
+        [sys.executable, "-m", "metaquery", "--help"],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    assert "--fields" in proc.stdout
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from metaquery import loader
+from metaquery.loader import YamlLoadError, load_fields, load_selection
+
+FIELDS_YML = """
+fields:
+  - field_id: model_id
+    datatable_id: MODELS
+    sql_expr: model_id
+""".lstrip()
+
+
+def test_fields_are_served_from_cache_while_unchanged(tmp_path, monkeypatch):
+    path = tmp_path / "fields.yml"
+    path.write_text(FIELDS_YML, encoding="utf-8")
+    first = load_fields(path)
+
+    def _no_parse(p):
+        raise AssertionError("fields.yml should not be parsed again")
+
+    monkeypatch.setattr(loader, "_parse_fields", _no_parse)
+    assert load_fields(path) == first
+
+
+def test_ids_are_interned_on_cache_hit(tmp_path, monkeypatch):
+    path = tmp_path / "fields.yml"
+    path.write_text(FIELDS_YML, encoding="utf-8")
+    load_fields(path)
+    monkeypatch.setattr(loader, "_parse_fields", lambda p: pytest.fail("cache miss"))
+
+    fields = load_fields(path)
+    (fid,) = fields
+    assert fid is sys.intern("model_id")
+    assert fields[fid].field_id is fid
+    assert fields[fid].datatable_id is sys.intern("MODELS")
+
+
+def test_fields_cache_is_invalidated_when_file_changes(tmp_path):
+    path = tmp_path / "fields.yml"
+    path.write_text(FIELDS_YML, encoding="utf-8")
+    load_fields(path)
+
+    path.write_text(FIELDS_YML.replace("MODELS", "RUNS"), encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    assert load_fields(path)["model_id"].datatable_id == "RUNS"
+
+
+def test_fields_cache_from_another_format_is_ignored(tmp_path):
+    path = tmp_path / "fields.yml"
+    path.write_text(FIELDS_YML, encoding="utf-8")
+    load_fields(path)
+
+    (cache_file,) = (tmp_path / "cache").glob("fields-*.json")
+    cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    cached["key"][0] = -1
+    cached["rows"] = [["model_id", "field_id", "datatable_id", "sql_expr", None, None]]
+    cache_file.write_text(json.dumps(cached), encoding="utf-8")
+
+    assert load_fields(path)["model_id"].datatable_id == "MODELS"
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="needs a filesystem accepting non-UTF-8 names")
+def test_fields_cache_accepts_non_utf8_paths(tmp_path):
+    path = Path(os.fsdecode(os.path.join(os.fsencode(tmp_path), b"f\xff.yml")))
+    path.write_text(FIELDS_YML, encoding="utf-8")
+    assert load_fields(path)["model_id"].datatable_id == "MODELS"
+    assert list((tmp_path / "cache").glob("fields-*.json"))
+    assert load_fields(path)["model_id"].datatable_id == "MODELS"
+
+
+def test_fields_load_without_a_home_directory(tmp_path, monkeypatch):
+    def _no_home():
+        raise RuntimeError("Could not determine home directory.")
+
+    monkeypatch.setattr(loader, "_CACHE_DIR", None)
+    monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+    monkeypatch.setattr(Path, "home", staticmethod(_no_home))
+    path = tmp_path / "fields.yml"
+    path.write_text(FIELDS_YML, encoding="utf-8")
+    assert load_fields(path)["model_id"].datatable_id == "MODELS"
+
+
+def test_json_inputs_are_accepted(tmp_path):
+    path = tmp_path / "selection.json"
+    path.write_text('{"selected_field_ids": ["model_id", "pd"]}', encoding="utf-8")
+    assert load_selection(path) == ["model_id", "pd"]
+
+    path.write_text('{"selected_field_ids": [', encoding="utf-8")
+    with pytest.raises(YamlLoadError, match="Invalid JSON"):
+        load_selection(path)
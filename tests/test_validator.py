@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import re
+
+import pytest
+
 from metaquery.loader import Field
-from metaquery.validator import validate_v1
+from metaquery.validator import _is_field_id, _is_source_name, validate_v1
 
 
 def _fields():
@@ -45,3 +49,26 @@ def test_single_source_allows():
     assert audit.decision == "ALLOW"
     assert audit.source == "MODELS"
     assert audit.status == "OK"
+
+
+def test_invalid_field_id_blocks():
+    _, audit = validate_v1(_fields(), ["model_id", "pd-1", "é"])
+    assert audit.decision == "BLOCK"
+    assert audit.error["code"] == "INVALID_FIELD_ID"
+    assert audit.error["invalid_field_ids"] == ["pd-1", "é"]
+
+
+def test_lowercase_source_name_blocks():
+    fields = {"x": Field(field_id="x", datatable_id="models", sql_expr="x")}
+    _, audit = validate_v1(fields, ["x"])
+    assert audit.decision == "BLOCK"
+    assert audit.error["code"] == "INVALID_SOURCE_NAME"
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["", "_", "___", "abc", "ABC", "A_1", "123", "aB_9", "é", "a-b", "a b", "X\n", "Ａ", "٣", "ß"],
+)
+def test_name_checks_match_spec_patterns(value):
+    assert _is_field_id(value) == bool(re.fullmatch(r"[A-Za-z0-9_]+", value))
+    assert _is_source_name(value) == bool(re.fullmatch(r"[A-Z0-9_]+", value))